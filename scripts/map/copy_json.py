@@ -1,8 +1,8 @@
-import json
+import orjson
 
 if __name__ == "__main__":
-    with open("output/london.json", "r") as json_file:
-        stations = json.load(json_file)
+    with open("output/london.json", "rb") as json_file:
+        stations = orjson.loads(json_file.read())
 
-    with open("./../../docs/maps/data/london.json", "w") as output_file:
-        json.dump(stations, output_file, separators=(',', ':'), indent=None)
+    with open("./../../docs/maps/data/london.json", "wb") as output_file:
+        output_file.write(orjson.dumps(stations))
@@ -1,53 +1,42 @@
-import json
 import matplotlib.pyplot as plt
-from collections import defaultdict
+import numpy as np
+import orjson
 
 MARKER_SIZE = 5
+CONTROL_POINTS = ("p0", "p1", "p2", "p3")
 
-def plot_line(line):
+def plot_line(ax, line):
     name = line["name"]
     color = line["color"]
     stations = line["stations"]
     edges = line["edges"]
 
-    x_coords = []
-    y_coords = []
-    for station in stations:
-        x_coords.append(station["x"])
-        y_coords.append(station["y"])
+    x_coords = np.fromiter((station["x"] for station in stations), dtype=float, count=len(stations))
+    y_coords = np.fromiter((station["y"] for station in stations), dtype=float, count=len(stations))
 
-    plt.plot(x_coords, y_coords, marker="o", linestyle="", color=color, markersize=MARKER_SIZE)
+    ax.plot(x_coords, y_coords, marker="o", linestyle="", color=color, markersize=MARKER_SIZE)
 
-    control_point_x_coords = []
-    control_point_y_coords = []
-    for edge in edges:
-        for line_segment in edge["lineSegments"]:
-            if not line_segment["straightLine"]:
-                control_point_x_coords.append(line_segment["p0"]["x"])
-                control_point_x_coords.append(line_segment["p1"]["x"])
-                control_point_x_coords.append(line_segment["p2"]["x"])
-                control_point_x_coords.append(line_segment["p3"]["x"])
+    curved_segments = [line_segment for edge in edges for line_segment in edge["lineSegments"]
+                       if not line_segment["straightLine"]]
+    control_points = [line_segment[point] for line_segment in curved_segments for point in CONTROL_POINTS]
+    control_point_x_coords = np.fromiter((point["x"] for point in control_points), dtype=float, count=len(control_points))
+    control_point_y_coords = np.fromiter((point["y"] for point in control_points), dtype=float, count=len(control_points))
 
-                control_point_y_coords.append(line_segment["p0"]["y"])
-                control_point_y_coords.append(line_segment["p1"]["y"])
-                control_point_y_coords.append(line_segment["p2"]["y"])
-                control_point_y_coords.append(line_segment["p3"]["y"])
-
-    plt.plot(control_point_x_coords, control_point_y_coords, marker="x", linestyle="", color=color, markersize=0.75 * MARKER_SIZE)
+    ax.plot(control_point_x_coords, control_point_y_coords, marker="x", linestyle="", color=color, markersize=0.75 * MARKER_SIZE)
 
 
 
 
 def plot_data():
-    json_file = open("output/london.json", "r")
-    lines = json.load(json_file)["metroLines"]
-    json_file.close()
+    with open("output/london.json", "rb") as json_file:
+        lines = orjson.loads(json_file.read())["metroLines"]
 
+    ax = plt.gca()
     for line in lines:
-        plot_line(line)
+        plot_line(ax, line)
 
-    plt.gca().invert_yaxis()
-    plt.gca().set_aspect('equal')
+    ax.invert_yaxis()
+    ax.set_aspect('equal')
     plt.show()
 
 
@@ -12,19 +12,29 @@ import java.io.FileWriter;
 import java.io.IOException;
 import java.nio.file.Files;
 import java.nio.file.Path;
-import java.util.ArrayList;
 import java.util.Arrays;
 import java.util.List;
 import java.util.Map;
 import java.util.Set;
-import java.util.stream.Stream;
+import java.util.function.Function;
+import java.util.regex.Pattern;
+import java.util.stream.Collectors;
 
 /** Class to interact with AMPL. */
 public class AmplDriver {
 
+    /** (?<!\\)\. matches . if not preceded by \. I.e. splits on non-escaped '.'. */
+    private static final Pattern UNESCAPED_DOT = Pattern.compile("(?<!\\\\)\\.");
+
+    /** Buffer size for AMPL output files. Constraints are many small writes, so these are flushed in large batches. */
+    private static final int WRITE_BUFFER_SIZE = 1 << 16;
+
     /** Path to the initial AMPL model file. */
     private final String initialModelPath;
 
+    /** Text of the initial AMPL model file before and after its %. Null until first read. */
+    private Pair<String, String> initialModelTemplate = null;
+
     /** AMPL model file. */
     private BufferedWriter amplModFile;
 
@@ -66,79 +76,94 @@ public class AmplDriver {
         return s.replace('-', '_');
     }
 
+    /**
+     * Reads the initial AMPL model file and splits it around its %. The result is cached, so the file is only read
+     * once per AmplDriver.
+     * @return The text of the initial model before and after the %.
+     */
+    private Pair<String, String> getInitialModelTemplate() throws IOException {
+        if (initialModelTemplate == null) {
+            String initialModelText = Files.readString(Path.of(initialModelPath));
+            int percentIndex = initialModelText.indexOf('%');
+            if (percentIndex == -1) {
+                throw new IllegalArgumentException("Cannot find % in initial AMPL model file.");
+            }
+            initialModelTemplate = Pair.of(initialModelText.substring(0, percentIndex),
+                    initialModelText.substring(percentIndex+1));
+        }
+        return initialModelTemplate;
+    }
+
     /**
      * Writes the initial part of the .mod file. This comes from a base template, which needs to have a % replaced
      * with station identifiers.
      * @param metroLines Map from metro line name -> MetroLine object for the metro lines in the network.
      */
     private void writeInitialModel(Map<String, MetroLine> metroLines) throws IOException {
-        String initialModelText = Files.readString(Path.of(initialModelPath));
-        int percentIndex = initialModelText.indexOf('%');
-        if (percentIndex == -1) {
-            throw new IllegalArgumentException("Cannot find % in initial AMPL model file.");
-        }
+        Pair<String, String> initialModel = getInitialModelTemplate();
 
-        amplModFile.write(initialModelText.substring(0, percentIndex));
+        String stationIdentifiers = metroLines.values().stream()
+                .flatMap(metroLine -> metroLine.getStations().values().stream())
+                .map(station -> '"' + station.getId() + '"')
+                .collect(Collectors.joining(", "));
 
-        ArrayList<String> stationIdentifiers = new ArrayList<>();
-        for (MetroLine metroLine : metroLines.values()) {
-            for (Station station : metroLine.getStations().values()) {
-                stationIdentifiers.add(String.format("\"%s\"", station.getId()));
-            }
-        }
-
-        amplModFile.write(String.join(", ", stationIdentifiers));
-        amplModFile.write(initialModelText.substring(percentIndex+1));
+        amplModFile.write(initialModel.getLeft());
+        amplModFile.write(stationIdentifiers);
+        amplModFile.write(initialModel.getRight());
         amplModFile.newLine();
     }
 
     /**
      * Writes a vertical constraint between two stations to the .mod file.
      * I.e. the two stations lie on the same vertical.
-     * @param station1Id Identifier of the first station, in the STATIONS AMPL set.
-     * @param station2Id Identifier of the second station, in the STATIONS AMPL set.
+     * @param station1 The first station.
+     * @param station2 The second station.
      */
-    private void writeVerticalConstraint(String station1Id, String station2Id) throws IOException {
-        amplModFile.write(String.format("subject to vertical_%s_%s: SOLVED_X_COORDS[\"%s\"] = SOLVED_X_COORDS[\"%s\"];",
-                amplSanitize(station1Id), amplSanitize(station2Id), station1Id, station2Id));
+    private void writeVerticalConstraint(Station station1, Station station2) throws IOException {
+        amplModFile.write(String.format("subject to vertical_%s_%s: %s = %s;",
+                amplSanitize(station1.getId()), amplSanitize(station2.getId()),
+                station1.getAmplXVariable(), station2.getAmplXVariable()));
         amplModFile.newLine();
     }
 
     /**
      * Writes a horizontal constraint between two stations to the .mod file.
      * I.e. the two stations lie on the same horizontal.
-     * @param station1Id Identifier of the first station, in the STATIONS AMPL set.
-     * @param station2Id Identifier of the second station, in the STATIONS AMPL set.
+     * @param station1 The first station.
+     * @param station2 The second station.
      */
-    private void writeHorizontalConstraint(String station1Id, String station2Id) throws IOException {
-        amplModFile.write(String.format("subject to horizontal_%s_%s: SOLVED_Y_COORDS[\"%s\"] = SOLVED_Y_COORDS[\"%s\"];",
-                amplSanitize(station1Id), amplSanitize(station2Id), station1Id, station2Id));
+    private void writeHorizontalConstraint(Station station1, Station station2) throws IOException {
+        amplModFile.write(String.format("subject to horizontal_%s_%s: %s = %s;",
+                amplSanitize(station1.getId()), amplSanitize(station2.getId()),
+                station1.getAmplYVariable(), station2.getAmplYVariable()));
         amplModFile.newLine();
     }
 
     /**
      * Writes a rising diagonal constraint between two stations to the .mod file.
      * I.e. the two stations lie on the same rising diagonal.
-     * @param station1Id Identifier of the first station, in the STATIONS AMPL set.
-     * @param station2Id Identifier of the second station, in the STATIONS AMPL set.
+     * @param station1 The first station.
+     * @param station2 The second station.
      */
-    private void writeRisingDiagonalConstraint(String station1Id, String station2Id) throws IOException {
-        amplModFile.write(String.format("subject to rising_diagonal_%s_%s: " +
-                "SOLVED_X_COORDS[\"%s\"] - SOLVED_X_COORDS[\"%s\"] = -(SOLVED_Y_COORDS[\"%s\"] - SOLVED_Y_COORDS[\"%s\"]);",
-                amplSanitize(station1Id), amplSanitize(station2Id), station1Id, station2Id, station1Id, station2Id));
+    private void writeRisingDiagonalConstraint(Station station1, Station station2) throws IOException {
+        String xDifference = station1.getAmplXVariable() + " - " + station2.getAmplXVariable();
+        String yDifference = station1.getAmplYVariable() + " - " + station2.getAmplYVariable();
+        amplModFile.write(String.format("subject to rising_diagonal_%s_%s: %s = -(%s);",
+                amplSanitize(station1.getId()), amplSanitize(station2.getId()), xDifference, yDifference));
         amplModFile.newLine();
     }
 
     /**
      * Writes a falling diagonal constraint between two stations to the .mod file.
      * I.e. the two stations lie on the same falling diagonal.
-     * @param station1Id Identifier of the first station, in the STATIONS AMPL set.
-     * @param station2Id Identifier of the second station, in the STATIONS AMPL set.
+     * @param station1 The first station.
+     * @param station2 The second station.
      */
-    private void writeFallingDiagonalConstraint(String station1Id, String station2Id) throws IOException {
-        amplModFile.write(String.format("subject to falling_diagonal_%s_%s: " +
-                "SOLVED_X_COORDS[\"%s\"] - SOLVED_X_COORDS[\"%s\"] = SOLVED_Y_COORDS[\"%s\"] - SOLVED_Y_COORDS[\"%s\"];",
-                amplSanitize(station1Id), amplSanitize(station2Id), station1Id, station2Id, station1Id, station2Id));
+    private void writeFallingDiagonalConstraint(Station station1, Station station2) throws IOException {
+        String xDifference = station1.getAmplXVariable() + " - " + station2.getAmplXVariable();
+        String yDifference = station1.getAmplYVariable() + " - " + station2.getAmplYVariable();
+        amplModFile.write(String.format("subject to falling_diagonal_%s_%s: %s = %s;",
+                amplSanitize(station1.getId()), amplSanitize(station2.getId()), xDifference, yDifference));
         amplModFile.newLine();
     }
 
@@ -162,34 +187,37 @@ public class AmplDriver {
     }
 
     /**
-     * Writes a cardinal direction constraint between two stations (a vertical, horizontal, or rising/falling diagonal constraint).
-     * @param station1Name Name of the first station.
-     * @param station2Name Name of the second station.
-     * @param constraintType Type of the constraint (one of 'vertical', 'horizontal', 'up-right', 'down-right').
-     * @param metroLine The metro line of these stations in the network. If null, to be read from each station.
+     * Resolves a station name, as it appears in a constraint, to a station object.
+     * @param stationName Name of the station. If metroLine is null, this must be of the form "lineName: stationName".
+     * @param metroLine The metro line of the station in the network. If null, to be read from the station name.
      * @param metroLines Map from metro line name -> MetroLine object for the metro lines in the network.
-     * @param textLineNumber Line number of the input which declared this constraint.
+     * @param textLineNumber Line number of the input which declared the constraint.
+     * @return The station.
      */
-    private void writeCardinalDirectionConstraint(String station1Name, String station2Name, String constraintType,
-                                                  MetroLine metroLine, Map<String, MetroLine> metroLines,
-                                                  int textLineNumber) throws IOException {
-        String station1Id;
-        String station2Id;
+    private static Station resolveStation(String stationName, MetroLine metroLine, Map<String, MetroLine> metroLines,
+                                          int textLineNumber) {
         if (metroLine == null) {
-            Pair<String, String> lineAndName1 = extractMetroLine(station1Name, textLineNumber);
-            Pair<String, String> lineAndName2 = extractMetroLine(station2Name, textLineNumber);
-            station1Id = metroLines.get(lineAndName1.getLeft()).getStation(lineAndName1.getRight(), textLineNumber).getId();
-            station2Id = metroLines.get(lineAndName2.getLeft()).getStation(lineAndName2.getRight(), textLineNumber).getId();
+            Pair<String, String> lineAndName = extractMetroLine(stationName, textLineNumber);
+            return metroLines.get(lineAndName.getLeft()).getStation(lineAndName.getRight(), textLineNumber);
         } else {
-            station1Id = metroLine.getStation(station1Name, textLineNumber).getId();
-            station2Id = metroLine.getStation(station2Name, textLineNumber).getId();
+            return metroLine.getStation(stationName, textLineNumber);
         }
+    }
 
+    /**
+     * Writes a cardinal direction constraint between two stations (a vertical, horizontal, or rising/falling diagonal constraint).
+     * @param station1 The first station.
+     * @param station2 The second station.
+     * @param constraintType Type of the constraint (one of 'vertical', 'horizontal', 'up-right', 'down-right').
+     * @param textLineNumber Line number of the input which declared this constraint.
+     */
+    private void writeCardinalDirectionConstraint(Station station1, Station station2, String constraintType,
+                                                  int textLineNumber) throws IOException {
         switch (constraintType) {
-            case "vertical" -> writeVerticalConstraint(station1Id, station2Id);
-            case "horizontal" -> writeHorizontalConstraint(station1Id, station2Id);
-            case "up-right" -> writeRisingDiagonalConstraint(station1Id, station2Id);
-            case "down-right" -> writeFallingDiagonalConstraint(station1Id, station2Id);
+            case "vertical" -> writeVerticalConstraint(station1, station2);
+            case "horizontal" -> writeHorizontalConstraint(station1, station2);
+            case "up-right" -> writeRisingDiagonalConstraint(station1, station2);
+            case "down-right" -> writeFallingDiagonalConstraint(station1, station2);
             default -> throw new IllegalArgumentException(String.format("Constraint (line %d) is invalid. Earlier code should have already validated this.", textLineNumber));
         }
     }
@@ -209,110 +237,113 @@ public class AmplDriver {
         Pair<String, String> doubleQuotedResult = Util.consumeDoubleQuoted(inputText, textLineNumber);
         String stationsString = doubleQuotedResult.getLeft().strip();
 
+        // Each station is resolved once, and reused as the first station of the following pair.
         List<Pair<String, String>> stationPairs = Util.allConsecutiveStationPairs(stationsString, textLineNumber);
+        Station currentStation = resolveStation(stationPairs.get(0).getLeft(), metroLine, metroLines, textLineNumber);
         for (Pair<String, String> stationPair : stationPairs) {
-            writeCardinalDirectionConstraint(stationPair.getLeft(), stationPair.getRight(), constraintType, metroLine,
-                    metroLines, textLineNumber);
+            Station nextStation = resolveStation(stationPair.getRight(), metroLine, metroLines, textLineNumber);
+            writeCardinalDirectionConstraint(currentStation, nextStation, constraintType, textLineNumber);
+            currentStation = nextStation;
         }
     }
 
     /**
      * Writes a 'same station' constraint between two stations, where one is directly above the other, to the .mod file.
-     * @param station1Id Identifier of the first station, in the STATIONS AMPL set.
-     * @param station2Id Identifier of the second station, in the STATIONS AMPL set.
+     * @param station1 The first station.
+     * @param station2 The second station.
      */
-    private void writeSameStationAboveConstraint(String station1Id, String station2Id) throws IOException {
-        writeVerticalConstraint(station1Id, station2Id);
-        amplModFile.write(String.format("subject to same_station_above_%s_%s: " +
-                "SOLVED_Y_COORDS[\"%s\"] + %d = SOLVED_Y_COORDS[\"%s\"];",
-                amplSanitize(station1Id), amplSanitize(station2Id), station1Id, metroLineWidth, station2Id));
+    private void writeSameStationAboveConstraint(Station station1, Station station2) throws IOException {
+        writeVerticalConstraint(station1, station2);
+        amplModFile.write(String.format("subject to same_station_above_%s_%s: %s + %d = %s;",
+                amplSanitize(station1.getId()), amplSanitize(station2.getId()),
+                station1.getAmplYVariable(), metroLineWidth, station2.getAmplYVariable()));
         amplModFile.newLine();
     }
 
     /**
      * Writes a 'same station' constraint between two stations, where one is directly left of the other, to the .mod file.
-     * @param station1Id Identifier of the first station, in the STATIONS AMPL set.
-     * @param station2Id Identifier of the second station, in the STATIONS AMPL set.
+     * @param station1 The first station.
+     * @param station2 The second station.
      */
-    private void writeSameStationLeftConstraint(String station1Id, String station2Id) throws IOException {
-        writeHorizontalConstraint(station1Id, station2Id);
-        amplModFile.write(String.format("subject to same_station_left_%s_%s: " +
-                "SOLVED_X_COORDS[\"%s\"] + %d = SOLVED_X_COORDS[\"%s\"];",
-                amplSanitize(station1Id), amplSanitize(station2Id), station1Id, metroLineWidth, station2Id));
+    private void writeSameStationLeftConstraint(Station station1, Station station2) throws IOException {
+        writeHorizontalConstraint(station1, station2);
+        amplModFile.write(String.format("subject to same_station_left_%s_%s: %s + %d = %s;",
+                amplSanitize(station1.getId()), amplSanitize(station2.getId()),
+                station1.getAmplXVariable(), metroLineWidth, station2.getAmplXVariable()));
         amplModFile.newLine();
     }
 
     /**
      * Writes a 'same station' constraint between two stations, where one is directly above and to the right of the other, to the .mod file.
-     * @param station1Id Identifier of the first station, in the STATIONS AMPL set.
-     * @param station2Id Identifier of the second station, in the STATIONS AMPL set.
+     * @param station1 The first station.
+     * @param station2 The second station.
      */
-    private void writeSameStationAboveRightConstraint(String station1Id, String station2Id) throws IOException {
-        amplModFile.write(String.format("subject to same_station_above_right_above_%s_%s: " +
-                "SOLVED_Y_COORDS[\"%s\"] + %d = SOLVED_Y_COORDS[\"%s\"];",
-                amplSanitize(station1Id), amplSanitize(station2Id), station1Id, diagonalOffset, station2Id));
+    private void writeSameStationAboveRightConstraint(Station station1, Station station2) throws IOException {
+        amplModFile.write(String.format("subject to same_station_above_right_above_%s_%s: %s + %d = %s;",
+                amplSanitize(station1.getId()), amplSanitize(station2.getId()),
+                station1.getAmplYVariable(), diagonalOffset, station2.getAmplYVariable()));
         amplModFile.newLine();
-        amplModFile.write(String.format("subject to same_station_above_right_right_%s_%s: " +
-                "SOLVED_X_COORDS[\"%s\"] - %d = SOLVED_X_COORDS[\"%s\"];",
-                amplSanitize(station1Id), amplSanitize(station2Id), station1Id, diagonalOffset, station2Id));
+        amplModFile.write(String.format("subject to same_station_above_right_right_%s_%s: %s - %d = %s;",
+                amplSanitize(station1.getId()), amplSanitize(station2.getId()),
+                station1.getAmplXVariable(), diagonalOffset, station2.getAmplXVariable()));
         amplModFile.newLine();
     }
 
     /**
      * Writes a 'same station' constraint between two stations, where one is directly above and to the left of the other, to the .mod file.
-     * @param station1Id Identifier of the first station, in the STATIONS AMPL set.
-     * @param station2Id Identifier of the second station, in the STATIONS AMPL set.
+     * @param station1 The first station.
+     * @param station2 The second station.
      */
-    private void writeSameStationAboveLeftConstraint(String station1Id, String station2Id) throws IOException {
-        amplModFile.write(String.format("subject to same_station_above_left_above_%s_%s: " +
-                "SOLVED_Y_COORDS[\"%s\"] + %d = SOLVED_Y_COORDS[\"%s\"];",
-                amplSanitize(station1Id), amplSanitize(station2Id), station1Id, diagonalOffset, station2Id));
+    private void writeSameStationAboveLeftConstraint(Station station1, Station station2) throws IOException {
+        amplModFile.write(String.format("subject to same_station_above_left_above_%s_%s: %s + %d = %s;",
+                amplSanitize(station1.getId()), amplSanitize(station2.getId()),
+                station1.getAmplYVariable(), diagonalOffset, station2.getAmplYVariable()));
         amplModFile.newLine();
-        amplModFile.write(String.format("subject to same_station_above_left_left_%s_%s: " +
-                "SOLVED_X_COORDS[\"%s\"] + %d = SOLVED_X_COORDS[\"%s\"];",
-                amplSanitize(station1Id), amplSanitize(station2Id), station1Id, diagonalOffset, station2Id));
+        amplModFile.write(String.format("subject to same_station_above_left_left_%s_%s: %s + %d = %s;",
+                amplSanitize(station1.getId()), amplSanitize(station2.getId()),
+                station1.getAmplXVariable(), diagonalOffset, station2.getAmplXVariable()));
         amplModFile.newLine();
     }
 
     /**
      * Writes a 'same station' constraint between two stations, where both are in the exact same location, to the .mod file.
-     * @param station1Id Identifier of the first station, in the STATIONS AMPL set.
-     * @param station2Id Identifier of the second station, in the STATIONS AMPL set.
+     * @param station1 The first station.
+     * @param station2 The second station.
      */
-    private void writeSameStationEqualConstraint(String station1Id, String station2Id) throws IOException {
-        amplModFile.write(String.format("subject to same_station_equal_x_%s_%s: " +
-                "SOLVED_X_COORDS[\"%s\"] = SOLVED_X_COORDS[\"%s\"];",
-                amplSanitize(station1Id), amplSanitize(station2Id), station1Id, station2Id));
+    private void writeSameStationEqualConstraint(Station station1, Station station2) throws IOException {
+        amplModFile.write(String.format("subject to same_station_equal_x_%s_%s: %s = %s;",
+                amplSanitize(station1.getId()), amplSanitize(station2.getId()),
+                station1.getAmplXVariable(), station2.getAmplXVariable()));
         amplModFile.newLine();
-        amplModFile.write(String.format("subject to same_station_equal_y_%s_%s: " +
-                "SOLVED_Y_COORDS[\"%s\"] = SOLVED_Y_COORDS[\"%s\"];",
-                amplSanitize(station1Id), amplSanitize(station2Id), station1Id, station2Id));
+        amplModFile.write(String.format("subject to same_station_equal_y_%s_%s: %s = %s;",
+                amplSanitize(station1.getId()), amplSanitize(station2.getId()),
+                station1.getAmplYVariable(), station2.getAmplYVariable()));
         amplModFile.newLine();
     }
 
     /**
      * Writes a 'same station' constraint between two stations.
-     * @param station1Id Identifier of the first station, in the STATIONS AMPL set.
-     * @param station2Id Identifier of the second station, in the STATIONS AMPL set.
+     * @param station1 The first station.
+     * @param station2 The second station.
      * @param constraintDirection Direction of the same-station constraint (one of "above", "below", "left", "right",
      *                            "above-left", "above-right", "below-left", "below-right", "equal").
      */
-    private void writeSameStationConstraint(String station1Id, String station2Id, String constraintDirection) throws IOException {
+    private void writeSameStationConstraint(Station station1, Station station2, String constraintDirection) throws IOException {
         // Only need 4 underlying constraint types, as we can reverse the order of station1 and station2
         switch (constraintDirection) {
-            case "above" -> writeSameStationAboveConstraint(station1Id, station2Id);
-            case "below" -> writeSameStationAboveConstraint(station2Id, station1Id);
+            case "above" -> writeSameStationAboveConstraint(station1, station2);
+            case "below" -> writeSameStationAboveConstraint(station2, station1);
 
-            case "left" -> writeSameStationLeftConstraint(station1Id, station2Id);
-            case "right" -> writeSameStationLeftConstraint(station2Id, station1Id);
+            case "left" -> writeSameStationLeftConstraint(station1, station2);
+            case "right" -> writeSameStationLeftConstraint(station2, station1);
 
-            case "above-right" -> writeSameStationAboveRightConstraint(station1Id, station2Id);
-            case "below-left" -> writeSameStationAboveRightConstraint(station2Id, station1Id);
+            case "above-right" -> writeSameStationAboveRightConstraint(station1, station2);
+            case "below-left" -> writeSameStationAboveRightConstraint(station2, station1);
 
-            case "above-left" -> writeSameStationAboveLeftConstraint(station1Id, station2Id);
-            case "below-right" -> writeSameStationAboveLeftConstraint(station2Id, station1Id);
+            case "above-left" -> writeSameStationAboveLeftConstraint(station1, station2);
+            case "below-right" -> writeSameStationAboveLeftConstraint(station2, station1);
 
-            case "exact" -> writeSameStationEqualConstraint(station1Id, station2Id);
+            case "exact" -> writeSameStationEqualConstraint(station1, station2);
 
             default -> throw new IllegalArgumentException(String.format("Unrecognized same-station constraint direction %s.", constraintDirection));
         }
@@ -332,14 +363,11 @@ public class AmplDriver {
             Pair<String, String> directionResult = Util.consumeToken(station1Result.getRight(), textLineNumber);
             Pair<String, String> station2Result = Util.consumeDoubleQuoted(directionResult.getRight(), textLineNumber);
 
-            Pair<String, String> lineAndName1 = extractMetroLine(station1Result.getLeft(), textLineNumber);
+            Station station1 = resolveStation(station1Result.getLeft(), null, metroLines, textLineNumber);
             String constraintDirection = directionResult.getLeft();
-            Pair<String, String> lineAndName2 = extractMetroLine(station2Result.getLeft(), textLineNumber);
-
-            String station1Id = metroLines.get(lineAndName1.getLeft()).getStation(lineAndName1.getRight(), textLineNumber).getId();
-            String station2Id = metroLines.get(lineAndName2.getLeft()).getStation(lineAndName2.getRight(), textLineNumber).getId();
+            Station station2 = resolveStation(station2Result.getLeft(), null, metroLines, textLineNumber);
 
-            writeSameStationConstraint(station1Id, station2Id, constraintDirection);
+            writeSameStationConstraint(station1, station2, constraintDirection);
         } else {
             // line is of the form "same-station line1Name dir line2Name \"station1, station2, ...\""
             Pair<String, String> token1Result = Util.consumeToken(inputText, textLineNumber);
@@ -355,9 +383,9 @@ public class AmplDriver {
             String[] stations = Arrays.stream(stationsString.split(",")).map(String::strip).toArray(String[]::new);
 
             for (String stationName : stations) {
-                String station1Id = metroLines.get(line1Name).getStation(stationName, textLineNumber).getId();
-                String station2Id = metroLines.get(line2Name).getStation(stationName, textLineNumber).getId();
-                writeSameStationConstraint(station1Id, station2Id, constraintDirection);
+                Station station1 = metroLines.get(line1Name).getStation(stationName, textLineNumber);
+                Station station2 = metroLines.get(line2Name).getStation(stationName, textLineNumber);
+                writeSameStationConstraint(station1, station2, constraintDirection);
             }
         }
     }
@@ -385,20 +413,19 @@ public class AmplDriver {
             constraintMetroLine = metroLines.get(metroLineName);
         }
 
-        // (?<!\\)\. matches . if not preceded by \. I.e. splits on non-escaped '.'.
-        String[] stationNameTokens = Arrays.stream(stationNameWithXOrY.split("(?<!\\\\)\\."))
+        String[] stationNameTokens = Arrays.stream(UNESCAPED_DOT.split(stationNameWithXOrY))
                 .map(s -> s.replace("\\.", ".")).toArray(String[]::new);// un-escape escaped dot
         if (stationNameTokens.length != 2) {
             throw new IllegalArgumentException(String.format("(line %d) Malformed station \"%s\" in equal expression.",
                     textLineNumber, stationNameWithXOrY));
         }
 
-        String stationId = constraintMetroLine.getStation(stationNameTokens[0].strip(), textLineNumber).getId();
+        Station station = constraintMetroLine.getStation(stationNameTokens[0].strip(), textLineNumber);
         String xOrY = stationNameTokens[1].strip();
 
         return switch (xOrY) {
-            case "x" -> String.format("SOLVED_X_COORDS[\"%s\"]", stationId);
-            case "y" -> String.format("SOLVED_Y_COORDS[\"%s\"]", stationId);
+            case "x" -> station.getAmplXVariable();
+            case "y" -> station.getAmplYVariable();
             default -> throw new IllegalArgumentException(String.format("(line %d) Unrecognized station part \"%s\".",
                     textLineNumber, xOrY));
         };
@@ -430,17 +457,15 @@ public class AmplDriver {
     }
 
     /**
-     * Processes a line of text which represents an alignment constraint between some number of stations.
-     * @param textLine The line of input that declares the constraint.
+     * Processes an alignment constraint between some number of stations.
+     * @param constraintType Type of the constraint (e.g. 'vertical', 'same-station').
+     * @param textLineRest The input text which declares the constraint, with the constraint type removed.
      * @param metroLine The metro line in the network of any stations referred to in the constraint. If null, to be read from each station.
      * @param metroLines Map from metro line name -> MetroLine object for the metro lines in the network.
      * @param textLineNumber Line number of the input which declared this constraint.
      */
-    private void processConstraint(String textLine, MetroLine metroLine, Map<String, MetroLine> metroLines,
+    private void processConstraint(String constraintType, String textLineRest, MetroLine metroLine, Map<String, MetroLine> metroLines,
                                    int textLineNumber) throws IOException {
-        String constraintType = textLine.split("\\s+")[0];
-        String textLineRest = Util.removePrefix(textLine, constraintType).strip();
-
         switch (constraintType) {
             case "vertical", "horizontal", "up-right", "down-right" ->
                     processCardinalDirectionConstraint(textLineRest, constraintType, metroLine, metroLines, textLineNumber);
@@ -457,8 +482,31 @@ public class AmplDriver {
      */
     private void processConstraints(List<AlignmentConstraint> alignmentConstraints, Map<String, MetroLine> metroLines) throws IOException {
         for (AlignmentConstraint alignmentConstraint : alignmentConstraints) {
-            processConstraint(alignmentConstraint.constraintText(), alignmentConstraint.metroLine(), metroLines, alignmentConstraint.textLineNumber());
+            processConstraint(alignmentConstraint.constraintType(), alignmentConstraint.constraintText(),
+                    alignmentConstraint.metroLine(), metroLines, alignmentConstraint.textLineNumber());
+        }
+    }
+
+    /**
+     * Writes a parameter indexed by station to the .dat file, with a value for every station in the network.
+     * @param paramName Name of the AMPL parameter.
+     * @param metroLines Map from metro line name -> MetroLine object for the metro lines in the network.
+     * @param value Function which gives the value of the parameter for a station.
+     */
+    private void writeStationParam(String paramName, Map<String, MetroLine> metroLines,
+                                   Function<Station, String> value) throws IOException {
+        amplDatFile.write(String.format("param %s :=", paramName));
+        for (MetroLine metroLine : metroLines.values()) {
+            for (Station station : metroLine.getStations().values()) {
+                amplDatFile.write(' ');
+                amplDatFile.write(station.getId());
+                amplDatFile.write(' ');
+                amplDatFile.write(value.apply(station));
+            }
         }
+        amplDatFile.write(";");
+        amplDatFile.newLine();
+        amplDatFile.newLine();
     }
 
     /**
@@ -472,38 +520,10 @@ public class AmplDriver {
         amplDatFile.newLine();
         amplDatFile.newLine();
 
-        Stream<Station> stations = metroLines.values().stream().flatMap(metroLine -> metroLine.getStations().values().stream());
-        ArrayList<String> xCoordTokens = new ArrayList<>();
-        ArrayList<String> yCoordTokens = new ArrayList<>();
-        ArrayList<String> isNotAlignmentPointTokens = new ArrayList<>();
-        stations.forEach(station -> {
-            xCoordTokens.add(station.getId());
-            xCoordTokens.add(Integer.toString(station.getOriginalX()));
-
-            yCoordTokens.add(station.getId());
-            yCoordTokens.add(Integer.toString(station.getOriginalY()));
-
-            isNotAlignmentPointTokens.add(station.getId());
-            isNotAlignmentPointTokens.add(station.isAlignmentPoint() ? GenerateMap.ALIGNMENT_POINT_WEIGHT : "1");
-        });
-
-        amplDatFile.write("param ORIGINAL_X_COORDS := ");
-        amplDatFile.write(String.join(" ", xCoordTokens));
-        amplDatFile.write(";");
-        amplDatFile.newLine();
-        amplDatFile.newLine();
-
-        amplDatFile.write("param ORIGINAL_Y_COORDS := ");
-        amplDatFile.write(String.join(" ", yCoordTokens));
-        amplDatFile.write(";");
-        amplDatFile.newLine();
-        amplDatFile.newLine();
-
-        amplDatFile.write("param ALIGNMENT_POINT_WEIGHT := ");
-        amplDatFile.write(String.join(" ", isNotAlignmentPointTokens));
-        amplDatFile.write(";");
-        amplDatFile.newLine();
-        amplDatFile.newLine();
+        writeStationParam("ORIGINAL_X_COORDS", metroLines, station -> Integer.toString(station.getOriginalX()));
+        writeStationParam("ORIGINAL_Y_COORDS", metroLines, station -> Integer.toString(station.getOriginalY()));
+        writeStationParam("ALIGNMENT_POINT_WEIGHT", metroLines,
+                station -> station.isAlignmentPoint() ? GenerateMap.ALIGNMENT_POINT_WEIGHT : "1");
     }
 
     /**
@@ -514,7 +534,7 @@ public class AmplDriver {
      */
     private void writeZIndexModel(String zAmplModPath, Map<String, MetroLine> metroLines,
                                   Set<ZIndexConstraint> zConstraints) throws IOException {
-        try (BufferedWriter zIndexAmplModFile = new BufferedWriter(new FileWriter(zAmplModPath))) {
+        try (BufferedWriter zIndexAmplModFile = new BufferedWriter(new FileWriter(zAmplModPath), WRITE_BUFFER_SIZE)) {
             String initialModelText = Files.readString(Path.of(initialZIndexModelPath));
             int firstPercentIndex = initialModelText.indexOf('%');
             if (firstPercentIndex == -1) throw new IllegalArgumentException("Cannot find first % in initial z-index AMPL model file.");
@@ -557,8 +577,8 @@ public class AmplDriver {
     public void writeAmplFiles(String amplModPath, String amplDatPath, String zAmplModPath, List<AlignmentConstraint> alignmentConstraints,
                                Set<ZIndexConstraint> zIndexConstraints, Map<String, MetroLine> metroLines) throws IOException {
         System.out.println("Writing AMPL files.");
-        try (BufferedWriter modFile = new BufferedWriter(new FileWriter(amplModPath));
-             BufferedWriter datFile = new BufferedWriter(new FileWriter(amplDatPath))) {
+        try (BufferedWriter modFile = new BufferedWriter(new FileWriter(amplModPath), WRITE_BUFFER_SIZE);
+             BufferedWriter datFile = new BufferedWriter(new FileWriter(amplDatPath), WRITE_BUFFER_SIZE)) {
             amplModFile = modFile;
             amplDatFile = datFile;
 
@@ -582,8 +602,8 @@ public class AmplDriver {
 
         for (MetroLine metroLine : metroLines.values()) {
             for (Station station : metroLine.getStations().values()) {
-                double solvedX = (double) ampl.getValue(String.format("SOLVED_X_COORDS[\"%s\"]", station.getId()));
-                double solvedY = (double) ampl.getValue(String.format("SOLVED_Y_COORDS[\"%s\"]", station.getId()));
+                double solvedX = (double) ampl.getValue(station.getAmplXVariable());
+                double solvedY = (double) ampl.getValue(station.getAmplYVariable());
 
                 assert MathUtil.approxInt(solvedX);
                 assert MathUtil.approxInt(solvedY);
@@ -618,8 +638,8 @@ public class AmplDriver {
 
             for (MetroLine metroLine : metroLines.values()) {
                 for (Station station : metroLine.getStations().values()) {
-                    double solvedX = (double) ampl.getValue(String.format("SOLVED_X_COORDS[\"%s\"]", station.getId()));
-                    double solvedY = (double) ampl.getValue(String.format("SOLVED_Y_COORDS[\"%s\"]", station.getId()));
+                    double solvedX = (double) ampl.getValue(station.getAmplXVariable());
+                    double solvedY = (double) ampl.getValue(station.getAmplYVariable());
 
                     // Transforms coordinates so that they are as far left and up as possible.
                     station.setSolvedX((int)Math.round(solvedX) - minX);
@@ -1,5 +1,6 @@
 package com.github.alexandergillon.mini_metro_maps;
 
+import com.fasterxml.jackson.databind.MappingIterator;
 import com.fasterxml.jackson.databind.ObjectMapper;
 import com.github.alexandergillon.mini_metro_maps.models.parsing.NaptanEntry;
 
@@ -17,11 +18,18 @@ public class NaptanReader {
     /** Underlying mapping from metro line name to station name to NAPTAN ID. */
     private final HashMap<String, HashMap<String, String>> lineToNameToNaptan = new HashMap<>();
 
+    /**
+     * NAPTAN IDs for stations which appear as multiple points on the map (Euston and Edgware Road), keyed by the
+     * station name used in the input file. These have suffixes attached to distinguish the points.
+     */
+    private final HashMap<String, String> splitStationNaptans = new HashMap<>();
+
     /** Jackson ObjectMapper for JSON parsing. */
     private final ObjectMapper objectMapper = new ObjectMapper();
 
     public NaptanReader(String path) throws IOException {
         buildNameToNaptan(path);
+        buildSplitStationNaptans();
     }
 
     /**
@@ -32,11 +40,12 @@ public class NaptanReader {
      * @throws NoSuchElementException If there is no NAPTAN entry for the station name.
      */
     public String getNaptan(String metroLineName, String stationName) throws NoSuchElementException {
+        String splitStationNaptan = splitStationNaptans.get(stationName);
+        if (splitStationNaptan != null) {
+            return splitStationNaptan;
+        }
+
         switch (stationName) {
-            case "Euston (Charing Cross branch)": return lineToNameToNaptan.get("northern").get("Euston") + "_CC";
-            case "Euston (Bank branch)": return lineToNameToNaptan.get("northern").get("Euston") + "_B";
-            case "Edgware Road (Circle Line) w/ H&C": return lineToNameToNaptan.get("circle").get("Edgware Road (Circle Line)") + "_HC";
-            case "Edgware Road (Circle Line) w/ District": return lineToNameToNaptan.get("circle").get("Edgware Road (Circle Line)") + "_D";
             case "Paddington":
                 // Paddington is a bit of a mess. TFL StopPoints API returns that the Paddington stop on the Bakerloo
                 // line has NAPTAN 940GZZLUPAC, but the TFL Arrivals API gives arrivals at NAPTAN 940GZZLUPAH.
@@ -53,12 +62,39 @@ public class NaptanReader {
                 break; // Else exit switch and do default.
         }
 
-        if (!lineToNameToNaptan.containsKey(metroLineName)
-                || !lineToNameToNaptan.get(metroLineName).containsKey(stationName)) {
+        String naptan = lookupNaptan(metroLineName, stationName);
+        if (naptan == null) {
             throw new NoSuchElementException(String.format("No NAPTAN entry for %s on line %s.", stationName, metroLineName));
-        } else {
-            return lineToNameToNaptan.get(metroLineName).get(stationName);
         }
+        return naptan;
+    }
+
+    /**
+     * Builds the splitStationNaptans mapping. Must be called after lineToNameToNaptan has been built. Split stations
+     * whose base NAPTAN is missing are left out, so that getNaptan() only fails if such a station is actually used.
+     */
+    private void buildSplitStationNaptans() {
+        String eustonNaptan = lookupNaptan("northern", "Euston");
+        if (eustonNaptan != null) {
+            splitStationNaptans.put("Euston (Charing Cross branch)", eustonNaptan + "_CC");
+            splitStationNaptans.put("Euston (Bank branch)", eustonNaptan + "_B");
+        }
+
+        String edgwareRoadNaptan = lookupNaptan("circle", "Edgware Road (Circle Line)");
+        if (edgwareRoadNaptan != null) {
+            splitStationNaptans.put("Edgware Road (Circle Line) w/ H&C", edgwareRoadNaptan + "_HC");
+            splitStationNaptans.put("Edgware Road (Circle Line) w/ District", edgwareRoadNaptan + "_D");
+        }
+    }
+
+    /**
+     * @param metroLineName Name of a metro line.
+     * @param stationName Name of a station.
+     * @return The NAPTAN ID for that station on that line from naptan.json, or null if there is no such entry.
+     */
+    private String lookupNaptan(String metroLineName, String stationName) {
+        HashMap<String, String> nameToNaptan = lineToNameToNaptan.get(metroLineName);
+        return nameToNaptan == null ? null : nameToNaptan.get(stationName);
     }
 
     /**
@@ -66,10 +102,12 @@ public class NaptanReader {
      * @param path Path to the naptan.json file.
      */
     private void buildNameToNaptan(String path) throws IOException {
-        NaptanEntry[] naptanEntries = objectMapper.readValue(new File(path), NaptanEntry[].class);
-        for (NaptanEntry naptanEntry : naptanEntries) {
-            lineToNameToNaptan.computeIfAbsent(naptanEntry.getMetroLine(), unused -> new HashMap<>())
-                    .put(naptanEntry.getName(), naptanEntry.getNaptanId());
+        try (MappingIterator<NaptanEntry> naptanEntries = objectMapper.readerFor(NaptanEntry.class).readValues(new File(path))) {
+            while (naptanEntries.hasNext()) {
+                NaptanEntry naptanEntry = naptanEntries.next();
+                lineToNameToNaptan.computeIfAbsent(naptanEntry.getMetroLine(), unused -> new HashMap<>())
+                        .put(naptanEntry.getName(), naptanEntry.getNaptanId());
+            }
         }
     }
 }
@@ -5,13 +5,13 @@ import com.github.alexandergillon.mini_metro_maps.models.core.Curve;
 import com.github.alexandergillon.mini_metro_maps.models.core.MetroLine;
 import com.github.alexandergillon.mini_metro_maps.models.core.Station;
 import com.github.alexandergillon.mini_metro_maps.models.core.ZIndexConstraint;
-import org.apache.commons.lang3.ArrayUtils;
 import org.apache.commons.lang3.tuple.Pair;
 import org.apache.commons.lang3.tuple.Triple;
 
-import java.io.BufferedReader;
-import java.io.FileReader;
 import java.io.IOException;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
 import java.util.ArrayList;
 import java.util.Arrays;
 import java.util.HashMap;
@@ -23,6 +23,17 @@ import java.util.Set;
 /** Class to read in data about the metro network. */
 public class Parser {
 
+    /** Valid directions for each half of a non-special curve type. */
+    private static final Set<String> CURVE_DIRECTIONS = Set.of(
+            "up", "down", "left", "right", "up-right", "up-left", "down-right", "down-left");
+
+    /**
+     * Left-facing direction constraints, mapped to their right-facing equivalents. Only right-facing directions are
+     * handled by the AMPL driver.
+     */
+    private static final Map<String, String> LEFT_TO_RIGHT_DIRECTIONS = Map.of(
+            "up-left", "down-right", "down-left", "up-right");
+
     /** Mapping from metro line name -> MetroLine object. */
     private final HashMap<String, MetroLine> metroLines = new HashMap<>();
 
@@ -86,10 +97,10 @@ public class Parser {
      * @return The new metro line object, which has been added to metroLines.
      */
     private MetroLine createNewMetroLine(String textLine) {
-        String[] tokens = textLine.split("\\s+"); // splits on whitespace
-        if (tokens.length == 0) parseException("Line %d does not have a metro line name.", textLineNumber);
+        String textRest = Util.consumeToken(textLine, textLineNumber).getRight();
+        if (textRest.isEmpty()) parseException("Line %d does not have a metro line name.", textLineNumber);
 
-        String metroLineName = tokens[1];
+        String metroLineName = Util.consumeToken(textRest, textLineNumber).getLeft();
         int colonIndex = metroLineName.indexOf(':');
         if (colonIndex != -1) {
             metroLineName = metroLineName.substring(0, colonIndex);
@@ -112,14 +123,14 @@ public class Parser {
     private void createNewStation(String textLine, MetroLine currentMetroLine, boolean isAlignmentPoint) {
         if (currentMetroLine == null) parseException("(line %d) Station declared before a current line was set.", textLineNumber);
 
-        textLine = isAlignmentPoint ? Util.removePrefix(textLine, "alignment-point")
-                : Util.removePrefix(textLine, "station").strip();
+        // consumeDoubleQuoted() scans ahead to the opening quote itself, so no strip is needed after the prefix.
+        textLine = Util.removePrefix(textLine, isAlignmentPoint ? "alignment-point" : "station");
 
         Pair<String, String> doubleQuotedResult = Util.consumeDoubleQuoted(textLine, textLineNumber);
         String stationName = doubleQuotedResult.getLeft().strip();
         String textRest = doubleQuotedResult.getRight().strip();
 
-        String[] tokens = textRest.split("\\s+");
+        String[] tokens = Util.WHITESPACE.split(textRest);
         if (tokens.length != 2) parseException("(line %d) Station declaration does not have both coordinates, or has trailing text.", textLineNumber);
 
         int x, y;
@@ -146,15 +157,13 @@ public class Parser {
     private void addEdges(String textLine, MetroLine currentMetroLine) {
         if (currentMetroLine == null) parseException("(line %d) Edges declared before a current line was set.", textLineNumber);
 
-        textLine = Util.removePrefix(textLine, "edges").strip();
+        textLine = Util.removePrefix(textLine, "edges");
 
         Pair<String, String> doubleQuotedResult = Util.consumeDoubleQuoted(textLine, textLineNumber);
         String stationsString = doubleQuotedResult.getLeft().strip();
 
         List<Pair<String, String>> stationPairs = Util.allConsecutiveStationPairs(stationsString, textLineNumber);
-        for (Pair<String, String> stationPair : stationPairs) {
-            currentMetroLine.addEdge(stationPair.getLeft(), stationPair.getRight(), textLineNumber);
-        }
+        currentMetroLine.addEdges(stationPairs, textLineNumber);
     }
 
     /**
@@ -165,9 +174,7 @@ public class Parser {
         if (!curveType.equals("special")) {
             String[] curveTypeTokens = curveType.split(",");
             if (curveTypeTokens.length != 2) parseException("(line %d) Invalid curve type \"%s\".", textLineNumber, curveType);
-
-            String[] validTokens = {"up", "down", "left", "right", "up-right", "up-left", "down-right", "down-left"};
-            if (!ArrayUtils.contains(validTokens, curveTypeTokens[0]) || !ArrayUtils.contains(validTokens, curveTypeTokens[1])) {
+            if (!CURVE_DIRECTIONS.contains(curveTypeTokens[0]) || !CURVE_DIRECTIONS.contains(curveTypeTokens[1])) {
                 parseException("(line %d) Invalid curve type \"%s\".", textLineNumber, curveType);
             }
         }
@@ -197,7 +204,7 @@ public class Parser {
     private void addCurve(String textLine, MetroLine currentMetroLine) {
         if (currentMetroLine == null) parseException("(line %d) Curve declared before a current line was set.", textLineNumber);
 
-        textLine = Util.removePrefix(textLine, "curve").strip();
+        textLine = Util.removePrefix(textLine, "curve");
 
         Pair<String, String> doubleQuotedResult = Util.consumeDoubleQuoted(textLine, textLineNumber);
         String stationsString = doubleQuotedResult.getLeft().strip();
@@ -236,7 +243,7 @@ public class Parser {
     private void addEndpoint(String textLine, MetroLine currentMetroLine) {
         if (currentMetroLine == null) parseException("(line %d) Endpoint declared before a current line was set.", textLineNumber);
 
-        textLine = Util.removePrefix(textLine, "endpoint").strip();
+        textLine = Util.removePrefix(textLine, "endpoint");
 
         Pair<String, String> doubleQuotedResult = Util.consumeDoubleQuoted(textLine, textLineNumber);
         String stationString = doubleQuotedResult.getLeft().strip();
@@ -251,7 +258,7 @@ public class Parser {
      */
     private void addZIndexConstraint(String textLine) {
         textLine = Util.removePrefix(textLine, "zindex").strip();
-        String[] tokens = textLine.split("\\s+");
+        String[] tokens = Util.WHITESPACE.split(textLine);
 
         if (tokens.length != 3) parseException("(line %d) z-index constraint declaration is invalid.", textLineNumber);
 
@@ -271,30 +278,22 @@ public class Parser {
      * @param textLine The line of input text to process.
      */
     private void processInputLine(String textLine) {
-        if (textLine.startsWith("line")) {
-            currentMetroLine = createNewMetroLine(textLine);
-        } else if (textLine.startsWith("station")) {
-            createNewStation(textLine, currentMetroLine, false);
-        } else if (textLine.startsWith("alignment-point")) {
-            createNewStation(textLine, currentMetroLine, true);
-        } else if (textLine.startsWith("edges")) {
-            addEdges(textLine, currentMetroLine);
-        } else if (textLine.startsWith("curve")) {
-            addCurve(textLine, currentMetroLine);
-        } else if (textLine.startsWith("multi-line")) {
-            currentMetroLine = null;
-        } else if (Util.startsWithAny(textLine, new String[]{"vertical", "horizontal", "up-right", "up-left", "down-right", "down-left"})) {
-            textLine = textLine.replace("up-left", "down-right");
-            textLine = textLine.replace("down-left", "up-right");
-            alignmentConstraints.add(new AlignmentConstraint(textLine, currentMetroLine, textLineNumber));
-        } else if (Util.startsWithAny(textLine, new String[]{"same-station", "equal"})) {
-            alignmentConstraints.add(new AlignmentConstraint(textLine, currentMetroLine, textLineNumber));
-        } else if (textLine.startsWith("endpoint")) {
-            addEndpoint(textLine, currentMetroLine);
-        } else if (textLine.startsWith("zindex")) {
-            addZIndexConstraint(textLine);
-        } else {
-            System.out.printf("(line %d) Warning: line with unrecognized form. Ignoring.%n", textLineNumber);
+        Pair<String, String> keywordAndRest = Util.consumeToken(textLine, textLineNumber);
+        String keyword = keywordAndRest.getLeft();
+        switch (keyword) {
+            case "line" -> currentMetroLine = createNewMetroLine(textLine);
+            case "station" -> createNewStation(textLine, currentMetroLine, false);
+            case "alignment-point" -> createNewStation(textLine, currentMetroLine, true);
+            case "edges" -> addEdges(textLine, currentMetroLine);
+            case "curve" -> addCurve(textLine, currentMetroLine);
+            case "multi-line", "multi-line:" -> currentMetroLine = null;
+            case "vertical", "horizontal", "up-right", "down-right", "same-station", "equal" ->
+                    alignmentConstraints.add(new AlignmentConstraint(keyword, keywordAndRest.getRight(), currentMetroLine, textLineNumber));
+            case "up-left", "down-left" -> alignmentConstraints.add(new AlignmentConstraint(
+                    LEFT_TO_RIGHT_DIRECTIONS.get(keyword), keywordAndRest.getRight(), currentMetroLine, textLineNumber));
+            case "endpoint" -> addEndpoint(textLine, currentMetroLine);
+            case "zindex" -> addZIndexConstraint(textLine);
+            default -> System.out.printf("(line %d) Warning: line with unrecognized form. Ignoring.%n", textLineNumber);
         }
     }
 
@@ -303,16 +302,14 @@ public class Parser {
      * `constraints` member variables.
      */
     private void readData() throws IOException {
-        try (BufferedReader bufferedReader = new BufferedReader(new FileReader(inputPath))) {
-            String textLine;
-            textLineNumber = 0;
-            while ((textLine = bufferedReader.readLine()) != null) {
-                textLineNumber++;
-                textLine = sanitizeTextLine(textLine);
-                if (textLine.isEmpty()) continue;
-
-                processInputLine(textLine);
-            }
+        List<String> textLines = Files.readString(Path.of(inputPath), StandardCharsets.UTF_8).lines().toList();
+        textLineNumber = 0;
+        for (String textLine : textLines) {
+            textLineNumber++;
+            textLine = sanitizeTextLine(textLine);
+            if (textLine.isEmpty()) continue;
+
+            processInputLine(textLine);
         }
     }
 
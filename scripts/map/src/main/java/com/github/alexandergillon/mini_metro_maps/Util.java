@@ -3,15 +3,18 @@ package com.github.alexandergillon.mini_metro_maps;
 import org.apache.commons.lang3.tuple.Pair;
 
 import java.util.ArrayList;
-import java.util.Arrays;
 import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
 import java.util.NoSuchElementException;
+import java.util.regex.Pattern;
 
 /** Class for various utility methods. */
 public class Util {
 
+    /** Matches a run of whitespace. */
+    public static final Pattern WHITESPACE = Pattern.compile("\\s+");
+
     private Util() {
         throw new IllegalStateException("Utility classes should not be instantiated.");
     }
@@ -27,7 +30,7 @@ public class Util {
         if (!s.startsWith(prefix)) {
             throw new IllegalArgumentException(String.format("String \"%s\" does not start with prefix \"%s\".", s, prefix));
         }
-        return s.replaceFirst("^" + prefix, "");
+        return s.substring(prefix.length());
     }
 
     /**
@@ -47,7 +50,8 @@ public class Util {
             return Pair.of(s, "");
         }
 
-        String token = s.substring(0, whitespaceIndex).strip();
+        // No strip needed: s has no leading whitespace, and the token ends at the first whitespace character.
+        String token = s.substring(0, whitespaceIndex);
         String rest = s.substring(whitespaceIndex+1).stripLeading();
 
         return Pair.of(token, rest);
@@ -60,31 +64,16 @@ public class Util {
      * @return The first double-quoted string within that string (without the quotes), and the rest of the string.
      */
     public static Pair<String, String> consumeDoubleQuoted(String s, int textLineNumber) {
-        s = s.stripLeading();
         int firstQuoteIndex = s.indexOf('"');
-        int secondQuoteIndex = s.indexOf('"', firstQuoteIndex+1);
+        int secondQuoteIndex = firstQuoteIndex == -1 ? -1 : s.indexOf('"', firstQuoteIndex+1);
 
-        if (firstQuoteIndex == -1 || secondQuoteIndex == -1) {
+        if (secondQuoteIndex == -1) {
             throw new IllegalArgumentException(String.format("(line %d) Double-quoted string expected.", textLineNumber));
         }
 
         return Pair.of(s.substring(firstQuoteIndex+1, secondQuoteIndex), s.substring(secondQuoteIndex+1));
     }
 
-    /**
-     * @param s A string.
-     * @param prefixes An array of prefixes.
-     * @return True if `s` starts with any prefix in `prefixes`.
-     */
-    public static boolean startsWithAny(String s, String[] prefixes) {
-        for (String prefix : prefixes) {
-            if (s.startsWith(prefix)) {
-                return true;
-            }
-        }
-        return false;
-    }
-
     /**
      * Gets all consecutive station pairs in a string of comma-delimited stations.
      * E.g. allConsecutiveStationPairs("station1, station2, station3, station4") -> [(station1, station2), (station2, station3), (station3, station4)]
@@ -96,21 +85,18 @@ public class Util {
     public static List<Pair<String, String>> allConsecutiveStationPairs(String stationsString, int textLineNumber) {
         stationsString = stationsString.strip();
 
-        String[] stations = Arrays.stream(stationsString.split(",")).map(String::strip).toArray(String[]::new);
+        String[] stations = stationsString.split(",");
         if (stations.length < 2) {
             throw new IllegalArgumentException(String.format("(line %d) Line has fewer than two stations when >= 2 were expected.", textLineNumber));
         }
 
-        ArrayList<Pair<String, String>> pairs = new ArrayList<>();
+        ArrayList<Pair<String, String>> pairs = new ArrayList<>(stations.length - 1);
 
-        String currentStation = stations[0];
-        String nextStation;
-        int index = 1;
-        while (index < stations.length) {
-            nextStation = stations[index];
+        String currentStation = stations[0].strip();
+        for (int i = 1; i < stations.length; i++) {
+            String nextStation = stations[i].strip();
             pairs.add(Pair.of(currentStation, nextStation));
             currentStation = nextStation;
-            index++;
         }
 
         return pairs;
@@ -1,4 +1,8 @@
 package com.github.alexandergillon.mini_metro_maps.models.core;
 
-/** POJO to hold information about an alignment constraint. */
-public record AlignmentConstraint(String constraintText, MetroLine metroLine, int textLineNumber) { }
+/**
+ * POJO to hold information about an alignment constraint. `constraintType` is the keyword which declared the
+ * constraint (e.g. 'vertical', 'same-station'), with left-facing directions already rewritten to their right-facing
+ * equivalents. `constraintText` is the text of the declaration after that keyword.
+ */
+public record AlignmentConstraint(String constraintType, String constraintText, MetroLine metroLine, int textLineNumber) { }
@@ -4,14 +4,6 @@ import java.util.Objects;
 
 /** Represents an edge between two stations on a metro line. */
 public record Edge(Station from, Station to) {
-    /**
-     * @param station A station.
-     * @return Whether this edge contains that station.
-     */
-    public boolean containsStation(Station station) {
-        return from.equals(station) || to.equals(station);
-    }
-
     /** Edges compare as equal regardless of ordering of stations. */
     @Override
     public boolean equals(Object o) {
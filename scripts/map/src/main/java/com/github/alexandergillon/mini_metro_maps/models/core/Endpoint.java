@@ -1,6 +1,7 @@
 package com.github.alexandergillon.mini_metro_maps.models.core;
 
 import com.github.alexandergillon.mini_metro_maps.GenerateMap;
+import com.github.alexandergillon.mini_metro_maps.Util;
 import com.github.alexandergillon.mini_metro_maps.models.bezier.Point;
 import com.github.alexandergillon.mini_metro_maps.models.output.OutputLineSegment;
 import org.apache.commons.lang3.ArrayUtils;
@@ -125,7 +126,7 @@ public class Endpoint {
      */
     private static Pair<String, String> getType(String textInput, int textLineNumber) {
         IllegalArgumentException badEndpoint = new IllegalArgumentException(String.format("(line %d) Invalid endpoint type \"%s\".", textLineNumber, textInput));
-        String[] tokens = textInput.split("\\s+");
+        String[] tokens = Util.WHITESPACE.split(textInput);
 
         if (tokens.length != 1) throw badEndpoint;
 
@@ -2,10 +2,12 @@ package com.github.alexandergillon.mini_metro_maps.models.core;
 
 import lombok.Getter;
 import lombok.Setter;
+import org.apache.commons.lang3.tuple.Pair;
 
 import java.util.ArrayList;
 import java.util.HashMap;
 import java.util.HashSet;
+import java.util.List;
 import java.util.NoSuchElementException;
 
 /** Represents a metro line. */
@@ -90,23 +92,17 @@ public class MetroLine {
     }
 
     /**
-     * Connects two stations in this metro line.
-     * @param station1Name Name of the first station.
-     * @param station2Name Name of the second station.
+     * Connects a number of pairs of stations in this metro line at once. Either all edges are added, or none are.
+     * @param stationPairs Pairs of names of stations to connect.
      * @param textLineNumber Line number of the input which used these station names.
      * @throws NoSuchElementException If this metro line does not contain one of the stations.
      */
-    public void addEdge(String station1Name, String station2Name, int textLineNumber) throws NoSuchElementException {
-        if (!stations.containsKey(station1Name)) {
-            throw new NoSuchElementException(String.format("(line %d) Station %s does not exist for line %s.",
-                    textLineNumber, station1Name, name));
+    public void addEdges(List<Pair<String, String>> stationPairs, int textLineNumber) throws NoSuchElementException {
+        ArrayList<Edge> newEdges = new ArrayList<>(stationPairs.size());
+        for (Pair<String, String> stationPair : stationPairs) {
+            newEdges.add(new Edge(getStation(stationPair.getLeft(), textLineNumber), getStation(stationPair.getRight(), textLineNumber)));
         }
-        if (!stations.containsKey(station2Name)) {
-            throw new NoSuchElementException(String.format("(line %d) Station %s does not exist for line %s.",
-                    textLineNumber, station2Name, name));
-        }
-
-        edges.add(new Edge(stations.get(station1Name), stations.get(station2Name)));
+        edges.addAll(newEdges);
     }
 
     /**
@@ -167,25 +163,17 @@ public class MetroLine {
      * @throws RuntimeException If this line has an orphan station.
      */
     public void assertNoOrphanStations() throws RuntimeException {
-        for (Station station : stations.values()) {
-            if (!station.isAlignmentPoint() && !containsEdgeWithStation(station)) {
-                throw new RuntimeException(String.format("Line %s has orphan station %s.", name, station.getName()));
-            }
+        HashSet<String> connectedStationNames = new HashSet<>();
+        for (Edge edge : edges) {
+            connectedStationNames.add(edge.from().getName());
+            connectedStationNames.add(edge.to().getName());
         }
-    }
 
-    /**
-     * @param station A station.
-     * @return Whether this metro line contains an edge with that station.
-     */
-    private boolean containsEdgeWithStation(Station station) {
-        // Not the most efficient, but it doesn't have to be.
-        for (Edge edge : edges) {
-            if (edge.containsStation(station)) {
-                return true;
+        for (Station station : stations.values()) {
+            if (!station.isAlignmentPoint() && !connectedStationNames.contains(station.getName())) {
+                throw new RuntimeException(String.format("Line %s has orphan station %s.", name, station.getName()));
             }
         }
-        return false;
     }
 
     @Override
@@ -19,6 +19,12 @@ public class Station {
     /** Unique identifier for this station. */
     private final String id;
 
+    /** AMPL variable for the solved x coordinate of this station. Built once, as it appears in many constraints. */
+    private final String amplXVariable;
+
+    /** AMPL variable for the solved y coordinate of this station. Built once, as it appears in many constraints. */
+    private final String amplYVariable;
+
     /** Original x coordinate of this station, from the input file. */
     private final int originalX;
 
@@ -41,6 +47,8 @@ public class Station {
         this.name = name;
 
         this.id = String.format("%s_%s", metroLineName, naptan);
+        this.amplXVariable = String.format("SOLVED_X_COORDS[\"%s\"]", id);
+        this.amplYVariable = String.format("SOLVED_Y_COORDS[\"%s\"]", id);
 
         this.originalX = x;
         this.originalY = y;
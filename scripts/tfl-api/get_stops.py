@@ -1,9 +1,10 @@
 # Script to pull the names and NAPTAN ids of all stops on the tube
 # Writes the names in a (nicer) human-readable format to 'output/human_readable.txt'
 # Writes names/NAPTAN id pairs in JSON to 'output/naptan.json'
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 import requests
 from typing import Optional, TextIO
 
@@ -19,13 +20,17 @@ lines = ["bakerloo",
          "victoria",
          "waterloo-city"]
 
+MAX_WORKERS = 8
+STATION_SUFFIX = "Underground Station"
+WRITE_BUFFER_SIZE = 1 << 20
+
 human_readable_file: Optional[TextIO] = None
 json_array = []
 
 
 def open_output_file():
     global human_readable_file
-    human_readable_file = open("output/human_readable.txt", "w")
+    human_readable_file = open("output/human_readable.txt", "w", buffering=WRITE_BUFFER_SIZE)
 
 
 def close_output_file():
@@ -33,47 +38,52 @@ def close_output_file():
 
 
 def write_json_file():
-    json_string = json.dumps(json_array, indent=2)
-    json_file = open("output/naptan.json", "w")
-    json_file.write(json_string)
-    json_file.close()
+    with open("output/naptan.json", "wb") as json_file:
+        json_file.write(orjson.dumps(json_array, option=orjson.OPT_INDENT_2))
 
 
-def get_stops_for_line(line):
-    human_readable_file.write(f"{line}:\n")
+def fetch_stops_for_line(session, line):
     url = f"https://api.tfl.gov.uk/line/{line}/StopPoints"
 
-    response = requests.get(url)
+    response = session.get(url)
     response.raise_for_status()
-    response_json = response.json()
+    return response.json()
+
+
+def get_stops_for_line(line, response_json):
+    human_readable_file.write(f"{line}:\n")
 
     for stop in response_json:
         name = stop["commonName"]
-        name = name.removesuffix("Underground Station").strip()
+        if name.endswith(STATION_SUFFIX):
+            name = name[:-len(STATION_SUFFIX)]
+        name = name.strip()
         human_readable_file.write(f"  \"{name}\"\n")
 
-        json_dict = dict()
-        json_dict["name"] = name
-        json_dict["metroLine"] = line
-        json_dict["naptanId"] = stop["naptanId"]
-        json_array.append(json_dict)
+        json_array.append({"name": name, "metroLine": line, "naptanId": stop["naptanId"]})
 
     human_readable_file.write("\n")
 
 
 def get_stops():
-    for line in lines:
-        get_stops_for_line(line)
+    # Requests are latency-bound, so fetch all lines concurrently, then write them out in order.
+    # The session is shared between threads: its connection pool is thread-safe, no hooks are registered, and the
+    # TfL API sets no cookies, so its other shared state is never mutated. The default pool size (10) covers every worker.
+    with requests.Session() as session:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            responses = executor.map(lambda line: fetch_stops_for_line(session, line), lines)
+            for line, response_json in zip(lines, responses):
+                get_stops_for_line(line, response_json)
 
 
 def main():
+    os.makedirs("output", exist_ok=True)
+    open_output_file()
     try:
-        os.makedirs("output", exist_ok=True)
-        open_output_file()
         get_stops()
-    except Exception as e:
-        print(e)
-    close_output_file()
+    finally:
+        close_output_file()
+    # Only reached if every line was fetched, so naptan.json is never written with some lines missing
     write_json_file()
 
 